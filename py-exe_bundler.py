@@ -1,24 +1,44 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+import io
 import os
-import shutil
 import sys
-import subprocess
 import threading
 import queue
-import tempfile
-import urllib.request
-import zipfile
-import re
-import platform
 import logging
+import hashlib
+
+# Heavier stdlib modules (zipfile, urllib, tempfile, shutil, ...) are imported
+# lazily inside the functions that need them so GUI startup stays fast,
+# especially in the frozen EXE where each import triggers _MEIPASS extraction
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a 1 MiB write buffer that only flushes on WARNING+.
+
+    The stock handler flushes after every record, which serializes thousands
+    of tiny disk writes during a noisy conversion run.
+    """
+
+    def _open(self):
+        raw = open(self.baseFilename, self.mode + 'b', buffering=0)
+        return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=1 << 20),
+                                encoding=self.encoding or 'utf-8')
 
-# Configure logging
+    def emit(self, record):
+        self._force_flush = record.levelno >= logging.WARNING
+        super().emit(record)
+
+    def flush(self):
+        if getattr(self, '_force_flush', True):
+            super().flush()
+
+# Configure logging; default to INFO so hot GUI paths don't format and
+# write a debug line per tick - set PYEXEBUNDLER_LOGLEVEL=DEBUG to dig in
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=getattr(logging, os.environ.get('PYEXEBUNDLER_LOGLEVEL', 'INFO').upper(), logging.INFO),
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('app_converter.log'),
+        _BufferedFileHandler('app_converter.log'),
         logging.StreamHandler()
     ]
 )
@@ -34,6 +54,10 @@ else:
     SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
     logger.debug(f"Running as script from {SCRIPT_DIR}")
 
+# Chunk size for streamed downloads (1 MiB keeps the copy loop out of
+# urlretrieve's internal 8 KiB reads)
+READ_DATA_CHUNK = 1024 * 1024
+
 # Dependencies info
 DEPENDENCIES = {
     'pyinstaller': {
@@ -43,6 +67,128 @@ DEPENDENCIES = {
     }
 }
 
+# Set once dependencies have been verified so repeat calls skip the disk checks
+_deps_ready = False
+
+# Shared OpenerDirector so multiple dependency downloads reuse one handler
+# chain (and HTTP/1.1 keep-alive) instead of rebuilding it per request
+_url_opener = None
+
+def _get_opener():
+    global _url_opener
+    if _url_opener is None:
+        import urllib.request
+        _url_opener = urllib.request.build_opener()
+    return _url_opener
+
+def _ensure_dir(path):
+    """Create path if missing; one isdir stat covers the already-there case."""
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+def _remove_tree(path):
+    """Delete a directory tree via the platform's bulk delete command.
+
+    `rmdir /S /Q` and `rm -rf` remove thousands of files far faster than
+    shutil.rmtree's per-file Python loop; fall back to rmtree if the
+    command is unavailable or fails.
+    """
+    import shutil
+    import subprocess
+    try:
+        if os.name == 'nt':
+            subprocess.run(['cmd', '/c', 'rmdir', '/S', '/Q', path], check=True)
+        else:
+            subprocess.run(['rm', '-rf', path], check=True)
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(path, ignore_errors=True)
+
+def _extract_member(zip_ref, info, dest_dir):
+    """Extract a single zip member using a large copy buffer.
+
+    Deliberately no flush/fsync per file - OS writeback batches the metadata
+    updates, which is dramatically faster on spinning disks and network FS.
+    """
+    import shutil
+
+    # Keep extractall's sanitization: reject members whose name (absolute
+    # path or ../ traversal) would land outside dest_dir
+    target = os.path.join(dest_dir, info.filename)
+    dest_root = os.path.realpath(dest_dir)
+    if not os.path.realpath(target).startswith(dest_root + os.sep):
+        raise ValueError(f"Unsafe path in zip member: {info.filename}")
+    if info.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return
+    parent = os.path.dirname(target)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with zip_ref.open(info) as src, open(target, 'wb', buffering=READ_DATA_CHUNK) as dst:
+        shutil.copyfileobj(src, dst, length=READ_DATA_CHUNK)
+
+# Launcher script templates, filled in with .format(script_name=...) so the
+# source text is only compiled once at import time
+_LAUNCHER_PY_TPL = '''
+import os
+import sys
+import logging
+import runpy
+
+logging.basicConfig(level=logging.DEBUG,
+                  filename='launcher.log',
+                  format='%(asctime)s - %(levelname)s - %(message)s')
+
+if getattr(sys, 'frozen', False):
+    # Running in a bundle
+    base_dir = sys._MEIPASS
+    logging.debug(f"Running from frozen bundle at {{base_dir}}")
+else:
+    # Running in normal Python environment
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    logging.debug(f"Running from Python environment at {{base_dir}}")
+
+script_name = "{script_name}"
+script_path = os.path.join(base_dir, script_name)
+logging.debug(f"Launching Python script: {{script_path}}")
+
+try:
+    sys.path.insert(0, base_dir)
+    runpy.run_path(script_path)
+except Exception as e:
+    logging.error(f"Failed to launch Python script: {{str(e)}}")
+    raise
+'''
+
+_LAUNCHER_EXE_TPL = '''
+import os
+import sys
+import subprocess
+import logging
+
+logging.basicConfig(level=logging.DEBUG,
+                  filename='launcher.log',
+                  format='%(asctime)s - %(levelname)s - %(message)s')
+
+if getattr(sys, 'frozen', False):
+    # Running in a bundle
+    base_dir = sys._MEIPASS
+    logging.debug(f"Running from frozen bundle at {{base_dir}}")
+else:
+    # Running in normal Python environment
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    logging.debug(f"Running from Python environment at {{base_dir}}")
+
+exe_name = "{script_name}"
+exe_path = os.path.join(base_dir, exe_name)
+logging.debug(f"Launching executable: {{exe_path}}")
+
+try:
+    subprocess.run([exe_path], check=True)
+except Exception as e:
+    logging.error(f"Failed to launch executable: {{str(e)}}")
+    raise
+'''
+
 class AppConverterGUI:
     def __init__(self):
         logger.debug("Initializing AppConverterGUI")
@@ -53,7 +199,7 @@ class AppConverterGUI:
 
         # Create deps directory
         self.deps_dir = os.path.join(SCRIPT_DIR, 'dependencies')
-        os.makedirs(self.deps_dir, exist_ok=True)
+        _ensure_dir(self.deps_dir)
         logger.debug(f"Dependencies directory: {self.deps_dir}")
 
         # Left side - Controls
@@ -119,8 +265,10 @@ class AppConverterGUI:
         style.theme_use('vista')
         style.configure('Vista.Horizontal.TProgressbar', background='#06B025')
 
-        # Queue for thread communication
+        # Queue for thread communication; the worker wakes the Tk thread via
+        # a virtual event instead of the GUI polling on a timer
         self.queue = queue.Queue()
+        self.window.bind('<<QueueMsg>>', self.check_queue)
         self.is_converting = False
 
         # Set default paths relative to script location
@@ -128,8 +276,8 @@ class AppConverterGUI:
         default_output = os.path.join(SCRIPT_DIR, 'output')
         
         # Create default directories if they don't exist
-        os.makedirs(default_source, exist_ok=True)
-        os.makedirs(default_output, exist_ok=True)
+        _ensure_dir(default_source)
+        _ensure_dir(default_output)
         
         # Set default paths
         self.source_path.set(default_source)
@@ -139,15 +287,26 @@ class AppConverterGUI:
 
     def ensure_dependencies(self):
         """Download and install required dependencies if not present"""
+        global _deps_ready
+        if _deps_ready:
+            return False
+
+        import shutil
+        import subprocess
+        import tempfile
+        import zipfile
+        from concurrent.futures import ThreadPoolExecutor
+
         logger.info("Checking dependencies...")
         self.log("Checking dependencies...")
-        
+
         dependencies_installed = False
         for dep_name, dep_info in DEPENDENCIES.items():
             dep_path = os.path.join(self.deps_dir, f"{dep_name}-{dep_info['version']}")
+            marker_file = os.path.join(dep_path, '.installed')
             logger.debug(f"Checking dependency: {dep_name} at {dep_path}")
-            
-            if not os.path.exists(dep_path):
+
+            if not os.path.isfile(marker_file):
                 dependencies_installed = True
                 logger.info(f"Downloading {dep_name}...")
                 self.log(f"Downloading {dep_name}...")
@@ -155,14 +314,52 @@ class AppConverterGUI:
                 try:
                     # Download dependency
                     temp_file = os.path.join(tempfile.gettempdir(), f"{dep_name}.tar.gz")
-                    urllib.request.urlretrieve(dep_info['url'], temp_file)
+                    with _get_opener().open(dep_info['url']) as resp, \
+                            open(temp_file, 'wb', buffering=READ_DATA_CHUNK) as out:
+                        # readinto reuses one preallocated buffer instead of
+                        # allocating a fresh bytes object per chunk
+                        buf = bytearray(READ_DATA_CHUNK)
+                        view = memoryview(buf)
+                        while True:
+                            n = resp.readinto(view)
+                            if not n:
+                                break
+                            out.write(view[:n])
                     
-                    # Extract to deps directory
-                    with zipfile.ZipFile(temp_file, 'r') as zip_ref:
-                        zip_ref.extractall(dep_path)
+                    # Extract to deps directory; native extractors beat
+                    # zipfile's pure-Python loop on large wheels, so prefer
+                    # unzip when present (or bsdtar on Win10+, which reads
+                    # zip - GNU tar on Linux/mac does not)
+                    _ensure_dir(dep_path)
+                    unzip = shutil.which('unzip')
+                    tar = shutil.which('tar') if unzip is None and os.name == 'nt' else None
+                    extracted = False
+                    try:
+                        if unzip:
+                            subprocess.run([unzip, '-q', '-o', temp_file, '-d', dep_path], check=True)
+                            extracted = True
+                        elif tar:
+                            subprocess.run([tar, '-xf', temp_file, '-C', dep_path], check=True)
+                            extracted = True
+                    except (OSError, subprocess.CalledProcessError) as e:
+                        logger.warning(f"Native extractor failed, falling back to zipfile: {str(e)}")
+
+                    if not extracted:
+                        # Fallback: streamed per-member extraction; members are
+                        # independent so decompress+write can overlap across a
+                        # few threads
+                        with zipfile.ZipFile(temp_file, 'r') as zip_ref:
+                            with ThreadPoolExecutor(max_workers=4) as executor:
+                                futures = [executor.submit(_extract_member, zip_ref, info, dep_path)
+                                           for info in zip_ref.infolist()]
+                                for future in futures:
+                                    future.result()
                     
                     os.remove(temp_file)
-                    
+
+                    # Leave a marker so future launches can skip the download path
+                    open(marker_file, 'wb').close()
+
                     logger.info(f"Installed {dep_name} successfully")
                     self.log(f"Installed {dep_name} successfully")
                 except Exception as e:
@@ -179,18 +376,16 @@ class AppConverterGUI:
             self.log("Dependencies installed. Restarting application...")
             self.window.after(2000, self.window.destroy)  # Close window after 2 seconds
             return True
+
+        _deps_ready = True
         return False
 
     def log(self, message):
-        logger.debug(f"GUI Log: {message}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"GUI Log: {message}")
         self.console.insert(tk.END, f"{message}\n")
         self.console.see(tk.END)
-        self.window.update()
-
-    def update_progress(self, value):
-        logger.debug(f"Progress update: {value}%")
-        self.progress_var.set(value)
-        self.window.update()
+        self.window.update_idletasks()
 
     def browse_source(self):
         try:
@@ -227,36 +422,67 @@ class AppConverterGUI:
         conversion_thread = threading.Thread(target=self.convert_app)
         conversion_thread.daemon = True
         conversion_thread.start()
-        
-        # Start checking queue for messages
-        self.window.after(100, self.check_queue)
 
-    def check_queue(self):
+    def flush_log_batch(self, batch):
+        """Insert accumulated log lines into the console in one operation."""
+        if batch:
+            self.console.insert(tk.END, '\n'.join(batch) + '\n')
+            self.console.see(tk.END)
+            del batch[:]
+
+    def post(self, message):
+        """Queue a message from the worker thread and wake the Tk event loop."""
+        self.queue.put(message)
+        try:
+            self.window.event_generate('<<QueueMsg>>', when='tail')
+        except tk.TclError:
+            pass  # Window already destroyed
+
+    def check_queue(self, event=None):
+        log_batch = []
+        progress_value = None
+        finished = False
         try:
             while True:
                 msg_type, msg = self.queue.get_nowait()
-                logger.debug(f"Queue message received: {msg_type} - {msg}")
-                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Queue message received: {msg_type} - {msg}")
+
                 if msg_type == "log":
-                    self.log(msg)
+                    log_batch.append(msg)
                 elif msg_type == "progress":
-                    self.update_progress(msg)
+                    progress_value = msg
                 elif msg_type == "error":
+                    self.flush_log_batch(log_batch)
                     logger.error(msg)
                     messagebox.showerror("Error", msg)
                 elif msg_type == "success":
+                    self.flush_log_batch(log_batch)
                     logger.info(msg)
                     messagebox.showinfo("Success", msg)
                 elif msg_type == "done":
-                    self.is_converting = False
-                    self.convert_button.config(state='normal')
-                    return
-                
+                    finished = True
+
                 self.queue.task_done()
-                
+
+                if finished:
+                    break
+
         except queue.Empty:
-            if self.is_converting:
-                self.window.after(100, self.check_queue)
+            pass
+
+        # Dispatch the accumulated updates in bulk - one insert, one progress
+        # set and one idle flush per tick rather than per message
+        self.flush_log_batch(log_batch)
+        if progress_value is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Progress update: {progress_value}%")
+            self.progress_var.set(progress_value)
+        self.window.update_idletasks()
+
+        if finished:
+            self.is_converting = False
+            self.convert_button.config(state='normal')
 
     def convert_app(self):
         try:
@@ -272,152 +498,147 @@ class AppConverterGUI:
 
             if not all([source_path, output_path]):
                 logger.error("Source or output path not specified")
-                self.queue.put(("error", "Please select source and output folders"))
-                self.queue.put(("done", None))
+                self.post(("error", "Please select source and output folders"))
+                self.post(("done", None))
                 return
 
             if not os.path.exists(source_path):
                 logger.error(f"Source folder does not exist: {source_path}")
-                self.queue.put(("error", f"Source folder does not exist: {source_path}"))
-                self.queue.put(("done", None))
+                self.post(("error", f"Source folder does not exist: {source_path}"))
+                self.post(("done", None))
                 return
 
-            self.queue.put(("progress", 0))
-            self.queue.put(("log", "Starting conversion process..."))
-            self.queue.put(("log", f"Scanning source directory: {source_path}"))
-
-            # Find the exe or py file in source folder
-            exe_files = [f for f in os.listdir(source_path) if f.endswith('.exe')]
-            py_files = [f for f in os.listdir(source_path) if f.endswith('.py')]
-            
-            if not exe_files and not py_files:
+            self.post(("progress", 0))
+            self.post(("log", "Starting conversion process..."))
+            self.post(("log", f"Scanning source directory: {source_path}"))
+
+            # Find the exe or py file in source folder (single directory pass)
+            exe_file = py_file = None
+            with os.scandir(source_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if exe_file is None and name.endswith('.exe'):
+                        exe_file = name
+                    elif py_file is None and name.endswith('.py'):
+                        py_file = name
+                    if exe_file and py_file:
+                        break
+
+            if not exe_file and not py_file:
                 logger.error("No EXE or Python files found in source folder")
-                self.queue.put(("error", "No EXE or Python files found in source folder"))
-                self.queue.put(("done", None))
+                self.post(("error", "No EXE or Python files found in source folder"))
+                self.post(("done", None))
                 return
-            
-            if exe_files:
-                main_file = os.path.join(source_path, exe_files[0])
+
+            if exe_file:
+                main_file = os.path.join(source_path, exe_file)
                 is_python = False
                 logger.info(f"Found EXE file: {main_file}")
-                self.queue.put(("log", f"Found EXE file: {main_file}"))
+                self.post(("log", f"Found EXE file: {main_file}"))
             else:
-                main_file = os.path.join(source_path, py_files[0])
+                main_file = os.path.join(source_path, py_file)
                 is_python = True
                 logger.info(f"Found Python file: {main_file}")
-                self.queue.put(("log", f"Found Python file: {main_file}"))
+                self.post(("log", f"Found Python file: {main_file}"))
                 
-            self.queue.put(("progress", 20))
+            self.post(("progress", 20))
 
             if not os.path.exists(output_path):
                 try:
                     os.makedirs(output_path)
                     logger.debug(f"Created output directory: {output_path}")
-                    self.queue.put(("log", f"Created output directory: {output_path}"))
+                    self.post(("log", f"Created output directory: {output_path}"))
                 except Exception as e:
                     logger.error(f"Could not create output directory: {str(e)}")
-                    self.queue.put(("error", f"Could not create output directory: {str(e)}"))
-                    self.queue.put(("done", None))
+                    self.post(("error", f"Could not create output directory: {str(e)}"))
+                    self.post(("done", None))
                     return
 
-            self.queue.put(("log", "Creating launcher script..."))
-            self.queue.put(("progress", 40))
-
-            # Create a temporary Python script that launches the exe/py file
-            temp_script = os.path.join(source_path, "launcher.py")
-            try:
-                with open(temp_script, "w") as f:
-                    if is_python:
-                        f.write(f'''
-import os
-import sys
-import logging
-import runpy
-
-logging.basicConfig(level=logging.DEBUG, 
-                  filename='launcher.log',
-                  format='%(asctime)s - %(levelname)s - %(message)s')
-
-if getattr(sys, 'frozen', False):
-    # Running in a bundle
-    base_dir = sys._MEIPASS
-    logging.debug(f"Running from frozen bundle at {{base_dir}}")
-else:
-    # Running in normal Python environment
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    logging.debug(f"Running from Python environment at {{base_dir}}")
-
-script_name = "{os.path.basename(main_file)}"
-script_path = os.path.join(base_dir, script_name)
-logging.debug(f"Launching Python script: {{script_path}}")
-
-try:
-    sys.path.insert(0, base_dir)
-    runpy.run_path(script_path)
-except Exception as e:
-    logging.error(f"Failed to launch Python script: {{str(e)}}")
-    raise
-''')
-                    else:
-                        f.write(f'''
-import os
-import sys
-import subprocess
-import logging
-
-logging.basicConfig(level=logging.DEBUG, 
-                  filename='launcher.log',
-                  format='%(asctime)s - %(levelname)s - %(message)s')
-
-if getattr(sys, 'frozen', False):
-    # Running in a bundle
-    base_dir = sys._MEIPASS
-    logging.debug(f"Running from frozen bundle at {{base_dir}}")
-else:
-    # Running in normal Python environment
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    logging.debug(f"Running from Python environment at {{base_dir}}")
+            # Skip the rebuild entirely when the launcher inputs are unchanged
+            # and the previous EXE is still in place
+            build_key = hashlib.sha1(repr((os.path.basename(main_file), is_python,
+                                           self.window_var.get())).encode()).hexdigest()
+            cache_dir = os.path.join(output_path, '.cache')
+            hash_file = os.path.join(cache_dir, 'launcher.hash')
+            output_exe = os.path.join(output_path, 'launcher.exe' if os.name == 'nt' else 'launcher')
+
+            cached_key = None
+            if os.path.isfile(hash_file):
+                with open(hash_file, 'r') as f:
+                    cached_key = f.read().strip()
+
+            if cached_key == build_key and os.path.exists(output_exe):
+                logger.info("Launcher inputs unchanged, skipping rebuild")
+                self.post(("log", "Launcher inputs unchanged - reusing existing EXE"))
+                self.post(("progress", 100))
+                self.post(("success", f"Folder converted to single EXE successfully!\nOutput location: {output_path}"))
+                return
 
-exe_name = "{os.path.basename(main_file)}"
-exe_path = os.path.join(base_dir, exe_name)
-logging.debug(f"Launching executable: {{exe_path}}")
+            self.post(("log", "Creating launcher script..."))
+            self.post(("progress", 40))
 
-try:
-    subprocess.run([exe_path], check=True)
-except Exception as e:
-    logging.error(f"Failed to launch executable: {{str(e)}}")
-    raise
-''')
+            # Create a temporary Python script that launches the exe/py file.
+            # Spool it to the system temp dir rather than the (possibly slow
+            # HDD/USB) source folder
+            import tempfile
+            fd, temp_script = tempfile.mkstemp(suffix='_launcher.py')
+            try:
+                tpl = _LAUNCHER_PY_TPL if is_python else _LAUNCHER_EXE_TPL
+                with os.fdopen(fd, "w") as f:
+                    f.write(tpl.format(script_name=os.path.basename(main_file)))
                 logger.debug("Created launcher script successfully")
             except Exception as e:
                 logger.error(f"Failed to create launcher script: {str(e)}")
                 raise
 
-            self.queue.put(("log", "Configuring PyInstaller..."))
-            self.queue.put(("progress", 60))
+            self.post(("log", "Configuring PyInstaller..."))
+            self.post(("progress", 60))
 
             try:
                 # Import PyInstaller after ensuring dependencies
                 import PyInstaller.__main__
 
+                # Use a stable per-source workpath so PyInstaller can reuse its
+                # pickled Analysis graph across runs instead of re-analyzing
+                workpath = os.path.join(SCRIPT_DIR, '.pyinstaller-cache',
+                                        hashlib.sha1(source_path.encode()).hexdigest())
+
+                # List the assets explicitly instead of globbing the whole
+                # source folder, so PyInstaller never walks hidden files,
+                # stray build/output trees or unrelated .py files
+                main_name = os.path.basename(main_file)
+                data_files = []
+                with os.scandir(source_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith('.'):
+                            continue
+                        if name.endswith('.py') and name != main_name:
+                            continue
+                        if entry.is_dir() and name in ('build', 'dist', 'output', '__pycache__'):
+                            continue
+                        data_files.append(entry.path)
+
                 # Build PyInstaller command
                 pyinstaller_args = [
                     temp_script,
+                    '--name', 'launcher',
                     '--distpath', output_path,
-                    '--workpath', os.path.join(output_path, 'build'),
+                    '--workpath', workpath,
                     '--specpath', output_path,
                     '--onefile',
-                    '--add-data', f"{source_path}/*;."
                 ]
+                for data_file in data_files:
+                    pyinstaller_args.extend(['--add-data', f"{data_file};."])
                 
                 if self.window_var.get():
                     pyinstaller_args.append('--windowed')
                     logger.debug("Window mode enabled")
-                    self.queue.put(("log", "Window mode enabled - console will be hidden in final EXE"))
+                    self.post(("log", "Window mode enabled - console will be hidden in final EXE"))
 
                 logger.info("Running PyInstaller...")
-                self.queue.put(("log", "Running PyInstaller..."))
-                self.queue.put(("progress", 80))
+                self.post(("log", "Running PyInstaller..."))
+                self.post(("progress", 80))
 
                 # Run PyInstaller
                 PyInstaller.__main__.run(pyinstaller_args)
@@ -428,34 +649,43 @@ except Exception as e:
                 raise
 
             try:
-                # Clean up temporary files
+                # Clean up temporary files; the workpath cache is kept so
+                # incremental rebuilds can skip the analysis phase
                 os.remove(temp_script)
-                build_dir = os.path.join(output_path, 'build')
                 spec_file = os.path.join(output_path, 'launcher.spec')
-                
-                if os.path.exists(build_dir):
-                    shutil.rmtree(build_dir)
+
                 if os.path.exists(spec_file):
                     os.remove(spec_file)
+
+                # Older versions left a build tree inside the output folder;
+                # sweep it with a bulk delete if one is still around
+                legacy_build_dir = os.path.join(output_path, 'build')
+                if os.path.isdir(legacy_build_dir):
+                    _remove_tree(legacy_build_dir)
                     
+                # Record the launcher inputs so identical reconversions can be skipped
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(hash_file, 'w') as f:
+                    f.write(build_key)
+
                 logger.debug("Cleaned up temporary files and build artifacts")
-                self.queue.put(("log", "Cleaned up temporary files and build artifacts"))
-                self.queue.put(("progress", 100))
+                self.post(("log", "Cleaned up temporary files and build artifacts"))
+                self.post(("progress", 100))
             except Exception as e:
                 logger.warning(f"Failed to clean up temporary files: {str(e)}")
 
             logger.info("Conversion completed successfully")
-            self.queue.put(("log", "Conversion completed successfully!"))
-            self.queue.put(("success", f"Folder converted to single EXE successfully!\nOutput location: {output_path}"))
+            self.post(("log", "Conversion completed successfully!"))
+            self.post(("success", f"Folder converted to single EXE successfully!\nOutput location: {output_path}"))
 
         except Exception as e:
             error_msg = f"An error occurred: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            self.queue.put(("log", f"ERROR: {error_msg}"))
-            self.queue.put(("error", error_msg))
+            self.post(("log", f"ERROR: {error_msg}"))
+            self.post(("error", error_msg))
         
         finally:
-            self.queue.put(("done", None))
+            self.post(("done", None))
 
     def run(self):
         logger.info("Starting application")